@@ -1,14 +1,20 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog, filedialog
+from tkinter import ttk
+import os
 import time
-import json
-from typing import Optional, List, Dict, Union
+import ast
+import itertools
+from functools import partial
+from typing import Optional, List, Dict, Iterable, Tuple, Deque
+from collections import Counter, deque
 from dataclasses import dataclass
+from types import MappingProxyType
 from enum import Enum, auto
 import webbrowser
-import random
 
 # ==================== Constants and Enums ====================
+REPO_URL = "https://github.com/Vladislav-Karat/List-program.git"
+
 class OperationType(Enum):
     INSERT_HEAD = auto()
     INSERT_TAIL = auto()
@@ -19,6 +25,7 @@ class OperationType(Enum):
     LOAD = auto()
     IMPORT = auto()
     EXPORT = auto()
+    INSERT_MANY = auto()
 
 class Theme(Enum):
     LIGHT = "light"
@@ -26,6 +33,68 @@ class Theme(Enum):
     BLUE = "blue"
     GREEN = "green"
 
+THEMES: Dict[Theme, Dict[str, str]] = {
+    Theme.LIGHT: {
+        "normal": "#E1F5FE",
+        "highlight": "#FFF9C4",
+        "head": "#C8E6C9",
+        "tail": "#FFCDD2",
+        "arrow": "#757575",
+        "prev_arrow": "#9E9E9E",
+        "text": "#212121",
+        "pointer_text": "#616161",
+        "border": "#BDBDBD",
+        "pointer_area": "#E0E0E0",
+        "canvas_bg": "white"
+    },
+    Theme.DARK: {
+        "normal": "#424242",
+        "highlight": "#FFA000",
+        "head": "#2E7D32",
+        "tail": "#C62828",
+        "arrow": "#9E9E9E",
+        "prev_arrow": "#757575",
+        "text": "#FAFAFA",
+        "pointer_text": "#BDBDBD",
+        "border": "#212121",
+        "pointer_area": "#616161",
+        "canvas_bg": "#303030"
+    },
+    Theme.BLUE: {
+        "normal": "#E3F2FD",
+        "highlight": "#B3E5FC",
+        "head": "#BBDEFB",
+        "tail": "#90CAF9",
+        "arrow": "#42A5F5",
+        "prev_arrow": "#1E88E5",
+        "text": "#0D47A1",
+        "pointer_text": "#1565C0",
+        "border": "#1976D2",
+        "pointer_area": "#BBDEFB",
+        "canvas_bg": "#E3F2FD"
+    },
+    Theme.GREEN: {
+        "normal": "#E8F5E9",
+        "highlight": "#C8E6C9",
+        "head": "#A5D6A7",
+        "tail": "#81C784",
+        "arrow": "#4CAF50",
+        "prev_arrow": "#2E7D32",
+        "text": "#1B5E20",
+        "pointer_text": "#2E7D32",
+        "border": "#43A047",
+        "pointer_area": "#C8E6C9",
+        "canvas_bg": "#E8F5E9"
+    }
+}
+
+_STATUS_COLORS = {
+    "success": "#388E3C",
+    "error": "#D32F2F",
+    "warning": "#FFA000",
+    "info": "#1976D2"
+}
+
 @dataclass
 class AnimationSettings:
     speed: float = 0.2
@@ -33,43 +102,92 @@ class AnimationSettings:
     node_scale: float = 1.0
     enable_physics: bool = False
 
+def _validate_index_text(text: str) -> bool:
+    # isdecimal (unlike isdigit) rejects characters such as "²" that int() cannot parse
+    return not text or text.isdecimal()
+
+def _write_json(path: str, obj) -> None:
+    """Encode ``obj`` compactly in one piece and write it with one call."""
+    import json
+    with open(path, "wb") as f:
+        f.write(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+def _read_json(path: str):
+    import json
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
 # ==================== Data Structures ====================
+# Unique per node (pooled nodes draw a fresh id on reuse); also used in canvas tags
+_node_id_counter = itertools.count()
+
 class Node:
+    __slots__ = ("value", "label", "next", "prev", "id", "canvas_ids")
+
     def __init__(self, value: str):
         self.value: str = str(value)
+        self.label: str = f"Data: {self.value}"
         self.next: Optional['Node'] = None
         self.prev: Optional['Node'] = None
-        self.id: int = hash(f"{value}_{time.time()}")
+        self.id: int = next(_node_id_counter)
+        self.canvas_ids: Optional[Dict[str, int]] = None
+
+# (OperationType value, value or value list, index, time.monotonic_ns())
+HistoryEntry = Tuple[int, object, Optional[int], int]
 
 class DoublyLinkedList:
+    POOL_LIMIT = 4096
+    # Undo depth: the oldest entries are dropped once this many operations are logged
+    HISTORY_LIMIT = 256
+
     def __init__(self):
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None
         self.length: int = 0
-        self.operation_history: List[Dict] = []
+        self.operation_history: Deque[HistoryEntry] = deque(maxlen=self.HISTORY_LIMIT)
+        self._recording = True
+        self._pool: List[Node] = []
+        # Position-ordered mirrors of the chain: nodes for O(1) indexing, values for C-level scans
+        self._nodes: List[Node] = []
+        self._values: List[str] = []
+        self._counts: Counter = Counter()
 
     def insert_at_head(self, value: str) -> None:
-        new_node = Node(value)
-        if not self.head:
-            self.head = self.tail = new_node
+        new_node = self._new_node(value)
+        if self.tail is None:
+            self._set_first(new_node)
         else:
             new_node.next = self.head
             self.head.prev = new_node
             self.head = new_node
-        self.length += 1
+            self._nodes.insert(0, new_node)
+            self._values.insert(0, new_node.value)
+            self._counts[new_node.value] += 1
+            self.length += 1
         self._record_operation(OperationType.INSERT_HEAD, value, 0)
 
     def insert_at_tail(self, value: str) -> None:
-        new_node = Node(value)
-        if not self.head:
-            self.head = self.tail = new_node
+        new_node = self._new_node(value)
+        if self.tail is None:
+            self._set_first(new_node)
         else:
             new_node.prev = self.tail
             self.tail.next = new_node
             self.tail = new_node
-        self.length += 1
+            self._nodes.append(new_node)
+            self._values.append(new_node.value)
+            self._counts[new_node.value] += 1
+            self.length += 1
         self._record_operation(OperationType.INSERT_TAIL, value, self.length-1)
 
+    def _set_first(self, node: Node) -> None:
+        """Make ``node`` the only element of an empty list."""
+        self.head = self.tail = node
+        self._nodes = [node]
+        self._values = [node.value]
+        self._counts[node.value] += 1
+        self.length = 1
+
     def insert_at_position(self, index: int, value: str) -> None:
         if index < 0 or index > self.length:
             raise IndexError("Index out of range")
@@ -78,101 +196,223 @@ class DoublyLinkedList:
         elif index == self.length:
             self.insert_at_tail(value)
         else:
-            new_node = Node(value)
-            current = self._get_node(index)
+            new_node = self._new_node(value)
+            current = self._nodes[index]
             new_node.prev = current.prev
             new_node.next = current
-            if current.prev:
-                current.prev.next = new_node
+            current.prev.next = new_node
             current.prev = new_node
+            self._nodes.insert(index, new_node)
+            self._values.insert(index, new_node.value)
+            self._counts[new_node.value] += 1
             self.length += 1
             self._record_operation(OperationType.INSERT_POS, value, index)
 
+    def insert_many(self, values: List[str], at: str = "tail") -> None:
+        """Link all values into one chain locally, then splice it onto the head or tail."""
+        if at not in ("head", "tail"):
+            raise ValueError("Insert position must be 'head' or 'tail'")
+        nodes, added = self._build_chain(values)
+        if not nodes:
+            return
+        if at == "tail" or self.tail is None:
+            self._splice_tail(nodes, added)
+        else:
+            nodes[-1].next = self.head
+            self.head.prev = nodes[-1]
+            self.head = nodes[0]
+            self._nodes[:0] = nodes
+            self._values[:0] = added
+            self._counts.update(added)
+            self.length += len(added)
+        self._record_operation(OperationType.INSERT_MANY, added, 0 if at == "head" else self.length - len(added))
+
+    def extend_from_iterable(self, values: Iterable) -> None:
+        """Append every value in a single pass, touching head/tail/length only once."""
+        nodes, added = self._build_chain(values)
+        if not nodes:
+            return
+        self._splice_tail(nodes, added)
+        self._record_operation(OperationType.LOAD, added, self.length - len(added))
+
+    def _build_chain(self, values: Iterable) -> Tuple[List[Node], List[str]]:
+        nodes: List[Node] = []
+        added: List[str] = []
+        last = None
+        new_node = self._new_node
+        for value in values:
+            node = new_node(value)
+            nodes.append(node)
+            added.append(node.value)
+            if last is not None:
+                node.prev = last
+                last.next = node
+            last = node
+        return nodes, added
+
+    def _splice_tail(self, nodes: List[Node], added: List[str]) -> None:
+        if self.tail is None:
+            self.head = nodes[0]
+        else:
+            nodes[0].prev = self.tail
+            self.tail.next = nodes[0]
+        self._nodes.extend(nodes)
+        self._values.extend(added)
+        self._counts.update(added)
+        self.tail = nodes[-1]
+        self.length += len(added)
+
     def delete_at_position(self, index: int) -> str:
-        if index < 0 or index >= self.length:
-            raise IndexError("Index out of range")
-        if self.length == 1:
-            value = self.head.value
-            self.head = self.tail = None
-        elif index == 0:
-            value = self.head.value
-            self.head = self.head.next
-            if self.head:
-                self.head.prev = None
-        elif index == self.length - 1:
-            value = self.tail.value
-            self.tail = self.tail.prev
-            if self.tail:
-                self.tail.next = None
+        removed = self._get_node(index)
+        prev_node, next_node = removed.prev, removed.next
+        if prev_node:
+            prev_node.next = next_node
+        else:
+            self.head = next_node
+        if next_node:
+            next_node.prev = prev_node
         else:
-            current = self._get_node(index)
-            value = current.value
-            current.prev.next = current.next
-            current.next.prev = current.prev
+            self.tail = prev_node
+        value = removed.value
+        del self._nodes[index]
+        del self._values[index]
+        self._discount(value)
+        self._release_node(removed)
         self.length -= 1
         self._record_operation(OperationType.DELETE, value, index)
         return value
 
     def clear(self) -> None:
+        self._release_chain(self._nodes)
+        self._nodes = []
+        # The old mirror is handed to the history record so undo can restore it
+        removed, self._values = self._values, []
+        self._counts.clear()
         self.head = self.tail = None
         self.length = 0
-        self._record_operation(OperationType.CLEAR, None, None)
+        self._record_operation(OperationType.CLEAR, removed, None)
+
+    def _delete_range(self, index: int, count: int) -> None:
+        """Unlink ``count`` consecutive nodes starting at ``index`` in one splice."""
+        if index < 0 or count < 1 or index + count > self.length:
+            raise IndexError("Index out of range")
+        removed = self._nodes[index:index + count]
+        before, after = removed[0].prev, removed[-1].next
+        if before:
+            before.next = after
+        else:
+            self.head = after
+        if after:
+            after.prev = before
+        else:
+            self.tail = before
+        for value in self._values[index:index + count]:
+            self._discount(value)
+        del self._nodes[index:index + count]
+        del self._values[index:index + count]
+        self._release_chain(removed)
+        self.length -= count
 
     def search(self, value: str) -> int:
-        current = self.head
-        index = 0
-        while current:
-            if current.value == value:
-                return index
-            current = current.next
-            index += 1
-        return -1
+        # Misses are answered by the value counts; hits scan the contiguous mirror in C
+        if value not in self._counts:
+            return -1
+        return self._values.index(value)
+
+    def _discount(self, value: str) -> None:
+        remaining = self._counts[value] - 1
+        if remaining:
+            self._counts[value] = remaining
+        else:
+            del self._counts[value]
+
+    def _new_node(self, value: str) -> Node:
+        """Take a node from the free-list if one is available, otherwise allocate."""
+        if not self._pool:
+            return Node(value)
+        node = self._pool.pop()
+        node.value = str(value)
+        node.label = f"Data: {node.value}"
+        node.id = next(_node_id_counter)
+        return node
+
+    def _release_node(self, node: Node) -> None:
+        if len(self._pool) < self.POOL_LIMIT:
+            # Drop everything the node refers to so a pooled node pins neither data nor canvas items
+            node.next = node.prev = node.value = node.label = node.canvas_ids = None
+            self._pool.append(node)
+
+    def _release_chain(self, nodes: List[Node]) -> None:
+        for node in nodes[:self.POOL_LIMIT - len(self._pool)]:
+            node.next = node.prev = node.value = node.label = node.canvas_ids = None
+            self._pool.append(node)
 
     def _get_node(self, index: int) -> Node:
         if index < 0 or index >= self.length:
             raise IndexError("Index out of range")
-        if index <= self.length // 2:
-            current = self.head
-            for _ in range(index):
-                current = current.next
-        else:
-            current = self.tail
-            for _ in range(self.length - 1 - index):
-                current = current.prev
-        return current
+        return self._nodes[index]
 
     def to_list(self) -> List[str]:
-        result = []
-        current = self.head
-        while current:
-            result.append(current.value)
-            current = current.next
-        return result
+        return list(self._values)
 
-    def _record_operation(self, op_type: OperationType, value: Optional[str], index: Optional[int]) -> None:
-        self.operation_history.append({
-            "type": op_type,
-            "value": value,
-            "index": index,
-            "timestamp": time.time(),
-            "state": self.to_list()
-        })
+    def _record_operation(self, op_type: OperationType, value, index: Optional[int]) -> None:
+        """Log just enough to invert the operation; bulk ops keep their value lists."""
+        if self._recording:
+            # A plain HistoryEntry tuple: cheaper than a dict, and it round-trips through JSON
+            self.operation_history.append((op_type.value, value, index, time.monotonic_ns()))
 
     def undo_last_operation(self) -> bool:
-        if len(self.operation_history) <= 1:
+        if not self.operation_history:
             return False
+        self._recording = False
+        try:
+            self._apply_inverse(self.operation_history[-1])
+        finally:
+            self._recording = True
+        # Pop only once the inverse succeeded, so a failed undo keeps its entry
         self.operation_history.pop()
-        if len(self.operation_history) > 0:
-            prev_state = self.operation_history[-1]["state"]
-            self._load_from_list(prev_state)
-            return True
-        return False
-
-    def _load_from_list(self, values: List[str]) -> None:
-        self.head = self.tail = None
-        self.length = 0
-        for value in values:
-            self.insert_at_tail(value)
+        return True
+
+    def _apply_inverse(self, entry: HistoryEntry) -> None:
+        op_type, value, index = OperationType(entry[0]), entry[1], entry[2]
+        if op_type in (OperationType.INSERT_HEAD, OperationType.INSERT_TAIL, OperationType.INSERT_POS):
+            self.delete_at_position(index)
+        elif op_type == OperationType.DELETE:
+            self.insert_at_position(index, value)
+        elif op_type in (OperationType.INSERT_MANY, OperationType.LOAD):
+            self._delete_range(index, len(value))
+        elif op_type == OperationType.CLEAR:
+            if self.length:
+                raise ValueError("Cannot undo clear: list is not empty")
+            self._load_from_list(value)
+
+    def restore(self, values: Iterable, history: Iterable[HistoryEntry]) -> None:
+        """Load ``values`` as the contents, with ``history`` as the undo log that led to them.
+
+        Raises ValueError, leaving the list untouched, if ``history`` cannot be undone from ``values``.
+        """
+        values = list(values)
+        history = deque((tuple(entry) for entry in history), maxlen=self.HISTORY_LIMIT)
+        # Undo the whole log on a scratch list first, so a mismatched log cannot fail mid-undo later
+        probe = DoublyLinkedList()
+        probe._load_from_list(values)
+        probe.operation_history = deque(history)
+        try:
+            while probe.undo_last_operation():
+                pass
+        except (IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"History does not match the list: {e}") from e
+        self._load_from_list(values)
+        self.operation_history = history
+
+    def _load_from_list(self, values: Iterable) -> None:
+        """Replace the contents with ``values`` in one linking pass, leaving the history untouched."""
+        self._release_chain(self._nodes)
+        self._nodes, self._values = self._build_chain(values)
+        self.head = self._nodes[0] if self._nodes else None
+        self.tail = self._nodes[-1] if self._nodes else None
+        self._counts = Counter(self._values)
+        self.length = len(self._values)
 
 # ==================== Visualization ====================
 class LinkedListVisualizer:
@@ -185,66 +425,40 @@ class LinkedListVisualizer:
         self.node_width = 120
         self.node_height = 80
         self.spacing = 150
+        # Rectangle corners relative to a node's top-left, plain and scaled 1.1x around its center
+        grow_x, grow_y = self.node_width * 0.05, self.node_height * 0.05
+        self._rect_geometry = {
+            False: (0, 0, self.node_width, self.node_height),
+            True: (-grow_x, -grow_y, self.node_width + grow_x, self.node_height + grow_y)
+        }
+        self.content_width = 0
+        self._idx_labels: List[str] = []
+        self._drawn_nodes: List[Node] = []
+        self._drawn_state: Dict[int, Tuple[int, str, bool, bool, bool]] = {}
+        self._first_drawn = 0
+        self._info_id: Optional[int] = None
+        self._redraw_scheduled = False
+        self.current_highlight = -1
 
     def _setup_theme(self) -> None:
-        if self.theme == Theme.LIGHT:
-            self.colors = {
-                "normal": "#E1F5FE",
-                "highlight": "#FFF9C4",
-                "head": "#C8E6C9",
-                "tail": "#FFCDD2",
-                "arrow": "#757575",
-                "prev_arrow": "#9E9E9E",
-                "text": "#212121",
-                "pointer_text": "#616161",
-                "border": "#BDBDBD",
-                "pointer_area": "#E0E0E0",
-                "canvas_bg": "white"
-            }
-        elif self.theme == Theme.DARK:
-            self.colors = {
-                "normal": "#424242",
-                "highlight": "#FFA000",
-                "head": "#2E7D32",
-                "tail": "#C62828",
-                "arrow": "#9E9E9E",
-                "prev_arrow": "#757575",
-                "text": "#FAFAFA",
-                "pointer_text": "#BDBDBD",
-                "border": "#212121",
-                "pointer_area": "#616161",
-                "canvas_bg": "#303030"
-            }
-        elif self.theme == Theme.BLUE:
-            self.colors = {
-                "normal": "#E3F2FD",
-                "highlight": "#B3E5FC",
-                "head": "#BBDEFB",
-                "tail": "#90CAF9",
-                "arrow": "#42A5F5",
-                "prev_arrow": "#1E88E5",
-                "text": "#0D47A1",
-                "pointer_text": "#1565C0",
-                "border": "#1976D2",
-                "pointer_area": "#BBDEFB",
-                "canvas_bg": "#E3F2FD"
-            }
-        else:  # GREEN
-            self.colors = {
-                "normal": "#E8F5E9",
-                "highlight": "#C8E6C9",
-                "head": "#A5D6A7",
-                "tail": "#81C784",
-                "arrow": "#4CAF50",
-                "prev_arrow": "#2E7D32",
-                "text": "#1B5E20",
-                "pointer_text": "#2E7D32",
-                "border": "#43A047",
-                "pointer_area": "#C8E6C9",
-                "canvas_bg": "#E8F5E9"
-            }
+        self.colors = THEMES[self.theme]
+        self._build_item_styles()
         self.canvas.config(bg=self.colors["canvas_bg"])
 
+    def _build_item_styles(self) -> None:
+        """Precompute the per-theme keyword arguments passed to every canvas item."""
+        colors = self.colors
+        self._rect_kw = dict(outline=colors["border"], width=2)
+        self._data_text_kw = dict(font=("Arial", 10, "bold"), fill=colors["text"])
+        self._ptr_rect_kw = dict(fill=colors["pointer_area"], outline=colors["border"])
+        self._ptr_text_kw = dict(font=("Consolas", 9), fill=colors["pointer_text"])
+        self._idx_text_kw = dict(font=("Arial", 9), fill=colors["pointer_text"])
+        self._info_text_kw = dict(anchor=tk.NW, fill=colors["text"], font=("Arial", 10, "bold"))
+        self._arrow_kw = {
+            "next": dict(arrow=tk.LAST, width=3, fill=colors["arrow"], arrowshape=(9, 12, 6)),
+            "prev": dict(arrow=tk.FIRST, width=3, fill=colors["prev_arrow"], arrowshape=(6, 12, 9))
+        }
+
     def set_theme(self, theme: Theme) -> None:
         self.theme = theme
         self._setup_theme()
@@ -253,139 +467,232 @@ class LinkedListVisualizer:
     def set_animation_settings(self, settings: AnimationSettings) -> None:
         self.animation_settings = settings
 
-    def draw(self, highlight_index: Union[int, List[int]] = -1) -> None:
+    def draw(self, highlight_index: int = -1) -> None:
+        self.build()
+        # Through highlight() so current_highlight records it and later redraws can clear it
+        self.highlight(highlight_index)
+
+    def build(self) -> None:
+        """Recreate the items of every visible node from scratch (first draw, theme change)."""
         self.canvas.delete("all")
-        current = self.linked_list.head
-        x, y = 50, 150
-        index = 0
-        if isinstance(highlight_index, int):
-            highlight_index = [highlight_index] if highlight_index != -1 else []
-        while current:
-            # Determine node color
-            if index in highlight_index:
-                color = self.colors["highlight"]
-            elif index == 0:
-                color = self.colors["head"]
-            elif index == self.linked_list.length-1:
-                color = self.colors["tail"]
-            else:
-                color = self.colors["normal"]
+        self._drawn_nodes = []
+        self._drawn_state = {}
+        self.current_highlight = -1
+        self._layout()
+        # Draw list info
+        self._info_id = self._draw_list_info()
+
+    def sync(self) -> None:
+        """Bring the canvas up to date, moving or recoloring the items of nodes that stay visible."""
+        if self._info_id is None:
+            self.build()
+            return
+        self.highlight(-1)
+        self._layout()
+        self.canvas.itemconfig(self._info_id, text=self._list_info_text())
+
+    def _layout(self) -> None:
+        """Diff the visible nodes against the last layout, keyed by node id.
+
+        Nodes that are new to the view get their items created; nodes that stay only
+        have the attributes that changed (position, color, pointers) updated, and the
+        items of nodes that left the view are deleted.
+        """
+        canvas = self.canvas
+        # Issue the Tcl "create" commands directly: the create_*() wrappers re-format
+        # the same option dicts into Tcl arguments for every single item
+        call, getint, path = canvas.tk.call, canvas.tk.getint, canvas._w
+        itemconfig, move = canvas.itemconfig, canvas.move
+        rect_opts = canvas._options(self._rect_kw)
+        data_opts = canvas._options(self._data_text_kw)
+        idx_opts = canvas._options(self._idx_text_kw)
+        ptr_rect_opts = canvas._options(self._ptr_rect_kw)
+        ptr_text_opts = canvas._options(self._ptr_text_kw)
+        next_arrow_opts = canvas._options(self._arrow_kw["next"])
+        prev_arrow_opts = canvas._options(self._arrow_kw["prev"])
+        nw, nh, sp = self.node_width, self.node_height, self.spacing
+        step, half_w, arrow_len = nw + sp, nw // 2, sp // 3
+        length = self.linked_list.length
+        last = length - 1
+        show_prev = length > 1
+        colors = self.colors
+        head_c, tail_c, normal_c = colors["head"], colors["tail"], colors["normal"]
+        idx_labels = self._idx_labels
+        if len(idx_labels) < length:
+            idx_labels.extend(f"Index: {i}" for i in range(len(idx_labels), length))
+        # Nodes sit on a fixed grid, so the visible index range follows from the scroll offset;
+        # nodes outside it (with their arrows) get no canvas items
+        view_left = canvas.canvasx(0) - nw - arrow_len
+        view_right = canvas.canvasx(canvas.winfo_width()) + arrow_len
+        index = min(length, max(0, int((view_left - 50) // step)))
+        current = self.linked_list._get_node(index) if index < length else None
+        self._first_drawn = index
+        drawn = self._drawn_nodes = []
+        old_state, state = self._drawn_state, {}
+        x, y = 50 + index * step, 150
+        mid_y, next_y, prev_y = y + nh // 2, y + nh - 25, y + nh - 45
+        while current and x <= view_right:
+            drawn.append(current)
+            node_id = current.id
+            # One shared tag per node (keyed by its unique id) groups all of its items
+            group = f"node{node_id}"
+            has_next = current.next is not None
+            has_prev = current.prev is not None
+            color = head_c if index == 0 else (tail_c if index == last else normal_c)
+            spec = state[node_id] = (index, color, has_next, has_prev, show_prev)
+            old = old_state.pop(node_id, None)
+            if old is not None and old[4] == show_prev:
+                if old != spec:
+                    ids = current.canvas_ids
+                    old_index, old_color, had_next, had_prev = old[:4]
+                    if old_index != index:
+                        move(group, (index - old_index) * step, 0)
+                        itemconfig(ids["idx_text"], text=idx_labels[index])
+                    if old_color != color:
+                        itemconfig(ids["rect"], fill=color)
+                    if had_next != has_next:
+                        itemconfig(ids["next_ptr_text"], text="Next: →" if has_next else "Next: NULL")
+                        if has_next:
+                            ids["next_arrow"] = getint(call(path, "create", "line", x + nw, mid_y,
+                                                            x + nw + arrow_len, mid_y,
+                                                            "-tags", group, *next_arrow_opts))
+                        else:
+                            canvas.delete(ids.pop("next_arrow"))
+                    if had_prev != has_prev:
+                        itemconfig(ids["prev_ptr_text"], text="Prev: ←" if has_prev else "Prev: NULL")
+                        if has_prev:
+                            ids["prev_arrow"] = getint(call(path, "create", "line", x - arrow_len, mid_y, x, mid_y,
+                                                            "-tags", group, *prev_arrow_opts))
+                        else:
+                            canvas.delete(ids.pop("prev_arrow"))
+                x += step
+                current = current.next
+                index += 1
+                continue
+            if old is not None:
+                canvas.delete(group)
+            ids = current.canvas_ids = {}
             # Draw the node
-            self._draw_node(x, y, current, color, index in highlight_index)
+            ids["rect"] = getint(call(path, "create", "rectangle", x, y, x + nw, y + nh,
+                                      "-fill", color, "-tags", (group, "node_bg"), *rect_opts))
+            ids["text"] = getint(call(path, "create", "text", x + half_w, y + 20,
+                                      "-text", current.label, "-tags", group, *data_opts))
+            # Draw pointer areas
+            ids["next_ptr"] = getint(call(path, "create", "rectangle", x, next_y, x + nw, next_y + 20,
+                                          "-tags", group, *ptr_rect_opts))
+            ids["next_ptr_text"] = getint(call(path, "create", "text", x + half_w, next_y + 10,
+                                               "-text", "Next: →" if has_next else "Next: NULL",
+                                               "-tags", group, *ptr_text_opts))
+            if has_prev or show_prev:
+                ids["prev_ptr"] = getint(call(path, "create", "rectangle", x, prev_y, x + nw, prev_y + 20,
+                                              "-tags", group, *ptr_rect_opts))
+                ids["prev_ptr_text"] = getint(call(path, "create", "text", x + half_w, prev_y + 10,
+                                                   "-text", "Prev: ←" if has_prev else "Prev: NULL",
+                                                   "-tags", group, *ptr_text_opts))
             # Draw index label
-            self._draw_index_label(x, y, index)
+            ids["idx_text"] = getint(call(path, "create", "text", x + half_w, y - 20,
+                                          "-text", idx_labels[index], "-tags", group, *idx_opts))
             # Draw connecting arrows
-            if current.next:
-                self._draw_arrow(
-                    x + self.node_width,
-                    y + self.node_height//2,
-                    x + self.node_width + self.spacing//3,
-                    y + self.node_height//2,
-                    "next"
-                )
-            if current.prev:
-                self._draw_arrow(
-                    x - self.spacing//3,
-                    y + self.node_height//2,
-                    x,
-                    y + self.node_height//2,
-                    "prev"
-                )
-            x += self.node_width + self.spacing
+            if has_next:
+                ids["next_arrow"] = getint(call(path, "create", "line", x + nw, mid_y, x + nw + arrow_len, mid_y,
+                                                "-tags", group, *next_arrow_opts))
+            if has_prev:
+                ids["prev_arrow"] = getint(call(path, "create", "line", x - arrow_len, mid_y, x, mid_y,
+                                                "-tags", group, *prev_arrow_opts))
+            x += step
             current = current.next
             index += 1
-        # Draw list info
-        self._draw_list_info()
-
-    def _draw_node(self, x: int, y: int, node: Node, color: str, highlighted: bool) -> None:
-        scale = 1.1 if highlighted else 1.0
-        scaled_width = self.node_width * scale
-        scaled_height = self.node_height * scale
-        offset_x = (scaled_width - self.node_width) / 2
-        offset_y = (scaled_height - self.node_height) / 2
-        self.canvas.create_rectangle(
-            x - offset_x, y - offset_y,
-            x + scaled_width - offset_x, y + scaled_height - offset_y,
-            fill=color, outline=self.colors["border"], width=2,
-            tags=f"node_{node.id}"
-        )
-        self.canvas.create_text(
-            x + self.node_width//2,
-            y + 20,
-            text=f"Data: {node.value}",
-            font=("Arial", 10, "bold"),
-            fill=self.colors["text"],
-            tags=f"node_text_{node.id}"
-        )
-        self._draw_pointer_area(x, y, "next", node.next is not None, node.id)
-        if node.prev is not None or self.linked_list.length > 1:
-            self._draw_pointer_area(x, y, "prev", node.prev is not None, node.id)
-
-    def _draw_pointer_area(self, x: int, y: int, pointer_type: str, has_connection: bool, node_id: int) -> None:
-        if pointer_type == "next":
-            y_pos = y + self.node_height - 25
-            text = "Next: " + ("→" if has_connection else "NULL")
-            tag = f"next_ptr_{node_id}"
-        else:  # prev
-            y_pos = y + self.node_height - 45
-            text = "Prev: " + ("←" if has_connection else "NULL")
-            tag = f"prev_ptr_{node_id}"
-        self.canvas.create_rectangle(
-            x, y_pos,
-            x + self.node_width, y_pos + 20,
-            fill=self.colors["pointer_area"], outline=self.colors["border"],
-            tags=tag
-        )
-        self.canvas.create_text(
-            x + self.node_width//2,
-            y_pos + 10,
-            text=text,
-            font=("Consolas", 9),
-            fill=self.colors["pointer_text"],
-            tags=f"{tag}_text"
-        )
-
-    def _draw_index_label(self, x: int, y: int, index: int) -> None:
-        self.canvas.create_text(
-            x + self.node_width//2,
-            y - 20,
-            text=f"Index: {index}",
-            fill=self.colors["pointer_text"],
-            font=("Arial", 9),
-            tags=f"index_label_{index}"
-        )
-
-    def _draw_arrow(self, x1: int, y1: int, x2: int, y2: int, arrow_type: str) -> None:
-        arrow_shape = (9, 12, 6) if arrow_type == "next" else (6, 12, 9)
-        arrow_pos = tk.LAST if arrow_type == "next" else tk.FIRST
-        color = self.colors["arrow"] if arrow_type == "next" else self.colors["prev_arrow"]
-        self.canvas.create_line(
-            x1, y1, x2, y2,
-            arrow=arrow_pos,
-            width=3,
-            fill=color,
-            arrowshape=arrow_shape
-        )
-
-    def _draw_list_info(self) -> None:
-        info_text = f"Length: {self.linked_list.length} | Head: {self.linked_list.head.value if self.linked_list.head else 'None'} | Tail: {self.linked_list.tail.value if self.linked_list.tail else 'None'}"
-        self.canvas.create_text(
-            10, 10,
-            text=info_text,
-            anchor=tk.NW,
-            fill=self.colors["text"],
-            font=("Arial", 10, "bold")
-        )
+        # Whatever is left belongs to nodes that were deleted or scrolled out of view
+        if old_state:
+            canvas.delete(*(f"node{node_id}" for node_id in old_state))
+        self._drawn_state = state
+
+    def schedule_redraw(self) -> None:
+        """Coalesce every redraw request made while handling one event into a single sync on idle."""
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.canvas.after_idle(self.flush_redraw)
+
+    def flush_redraw(self) -> None:
+        if not self._redraw_scheduled:
+            return
+        self._redraw_scheduled = False
+        # Shrinking the scroll region can shift the view, so set it before culling against canvasx(0)
+        self.update_scroll_region()
+        self.sync()
+
+    def update_scroll_region(self) -> None:
+        # Node layout is fixed, so the extent follows from the list length without a bbox("all") walk
+        step = self.node_width + self.spacing
+        self.content_width = 50 + max(self.linked_list.length, 1) * step - self.spacing + 50
+        self.canvas.configure(scrollregion=(0, 0, self.content_width, 150 + self.node_height + 50))
+
+    def refresh_viewport(self) -> None:
+        """Update the visible window after a scroll or resize, keeping the current highlight."""
+        highlighted = self.current_highlight
+        self.sync()
+        self.highlight(highlighted)
+
+    def highlight(self, index: int) -> None:
+        """Move the highlight to ``index`` (-1 clears it) touching only two rectangles."""
+        # Animations must see the canvas for the current list, not a pending one
+        if self._redraw_scheduled:
+            self.flush_redraw()
+        if index == self.current_highlight:
+            return
+        if self.current_highlight != -1:
+            self._paint_node(self.current_highlight, False)
+        if 0 <= index < self.linked_list.length:
+            self._paint_node(index, True)
+            self.current_highlight = index
+        else:
+            self.current_highlight = -1
 
-    def animate_operation(self, highlight_indices: List[int], callback=None) -> None:
-        for i in highlight_indices:
-            self.draw([i])
-            self.canvas.update()
-            time.sleep(self.animation_settings.speed)
-        self.draw()
+    def _paint_node(self, index: int, highlighted: bool) -> None:
+        position = index - self._first_drawn
+        if not 0 <= position < len(self._drawn_nodes):
+            return
+        node = self._drawn_nodes[position]
+        state = self._drawn_state.get(node.id)
+        # The list may have changed since the last layout; a node released back to
+        # the pool (and possibly reused under a new id) no longer owns those items
+        if state is None or not node.canvas_ids:
+            return
+        rect_id = node.canvas_ids["rect"]
+        x = 50 + index * (self.node_width + self.spacing)
+        # Restore the color the last layout gave the node, which stays right even if the list changed since
+        color = self.colors["highlight"] if highlighted else state[1]
+        x0, y0, x1, y1 = self._rect_geometry[highlighted]
+        self.canvas.coords(rect_id, x + x0, 150 + y0, x + x1, 150 + y1)
+        self.canvas.itemconfig(rect_id, fill=color)
+
+    def _list_info_text(self) -> str:
+        return f"Length: {self.linked_list.length} | Head: {self.linked_list.head.value if self.linked_list.head else 'None'} | Tail: {self.linked_list.tail.value if self.linked_list.tail else 'None'}"
+
+    def _draw_list_info(self) -> int:
+        return self.canvas.create_text(10, 10, text=self._list_info_text(), **self._info_text_kw)
+
+    def animate_operation(self, highlight_indices: List[int], callback=None, step: int = 0) -> None:
+        """Highlight each index in turn, rescheduling itself via ``after`` so the mainloop keeps running."""
+        if step < len(highlight_indices):
+            self.highlight(highlight_indices[step])
+            self.canvas.after(int(self.animation_settings.speed * 1000),
+                              self.animate_operation, highlight_indices, callback, step + 1)
+            return
+        self.highlight(-1)
         if callback:
             callback()
 
+    def blink(self, index: int, callback=None, times: int = 3) -> None:
+        """Toggle one node's highlight ``times`` times, scheduling every frame up front."""
+        self.highlight(-1)
+        delay = int(self.animation_settings.speed * 1000)
+        # Go through highlight() so current_highlight tracks the blink and sync() can clear it
+        for frame in range(2 * times):
+            self.canvas.after(frame * delay, self.highlight, index if frame % 2 == 0 else -1)
+        if callback:
+            self.canvas.after(2 * times * delay, callback)
+
 # ==================== Main Application ====================
 class LinkedListApp:
     def __init__(self, root: tk.Tk):
@@ -396,6 +703,16 @@ class LinkedListApp:
         self.linked_list = DoublyLinkedList()
         self.animation_settings = AnimationSettings()
         self.current_theme = Theme.LIGHT
+        self._pending_resize = None
+        self._pending_speed_update = None
+        self._reset_styles_job = None
+        self._pending_status: Optional[Tuple[str, str]] = None
+        self._shown_status: Optional[Tuple[str, str]] = None
+        self._status_scheduled = False
+        self._confirm_dialog: Optional[tk.Toplevel] = None
+        self._load_dialog: Optional[tk.Toplevel] = None
+        self._load_var = tk.StringVar()
+        self._animating = False
         self._configure_styles()
         self._create_widgets()
         self._setup_layout()
@@ -405,7 +722,11 @@ class LinkedListApp:
         self._add_sample_data()
 
     def _configure_styles(self) -> None:
-        style = ttk.Style()
+        # ttk styles live in the Tcl interpreter, so configure them once per root
+        if getattr(self.root, "_list_styles_configured", False):
+            return
+        self.root._list_styles_configured = True
+        style = ttk.Style(self.root)
         style.theme_use("clam")
         style.configure(".", font=("Arial", 10))
         style.configure("TFrame", background="#f0f0f0")
@@ -510,8 +831,13 @@ class LinkedListApp:
             text="Import from JSON",
             command=self._import_from_json
         )
+        self.insert_csv_btn = ttk.Button(
+            self.ops_frame,
+            text="Insert CSV at Tail",
+            command=self._insert_csv
+        )
         self.canvas = tk.Canvas(self.canvas_frame, bg="white", highlightthickness=0)
-        self.scroll_x = ttk.Scrollbar(self.canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.scroll_x = ttk.Scrollbar(self.canvas_frame, orient=tk.HORIZONTAL, command=self._on_xscroll)
         self.scroll_y = ttk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
         self.canvas.configure(xscrollcommand=self.scroll_x.set, yscrollcommand=self.scroll_y.set)
         self.visualizer = LinkedListVisualizer(self.canvas, self.linked_list)
@@ -519,19 +845,19 @@ class LinkedListApp:
         self.theme_var = tk.StringVar(value="light")
         self.theme_light_btn = ttk.Radiobutton(
             self.settings_frame, text="Light", variable=self.theme_var,
-            value="light", command=lambda: self._change_theme(Theme.LIGHT)
+            value="light", command=partial(self._change_theme, Theme.LIGHT)
         )
         self.theme_dark_btn = ttk.Radiobutton(
             self.settings_frame, text="Dark", variable=self.theme_var,
-            value="dark", command=lambda: self._change_theme(Theme.DARK)
+            value="dark", command=partial(self._change_theme, Theme.DARK)
         )
         self.theme_blue_btn = ttk.Radiobutton(
             self.settings_frame, text="Blue", variable=self.theme_var,
-            value="blue", command=lambda: self._change_theme(Theme.BLUE)
+            value="blue", command=partial(self._change_theme, Theme.BLUE)
         )
         self.theme_green_btn = ttk.Radiobutton(
             self.settings_frame, text="Green", variable=self.theme_var,
-            value="green", command=lambda: self._change_theme(Theme.GREEN)
+            value="green", command=partial(self._change_theme, Theme.GREEN)
         )
         self.animation_frame = ttk.LabelFrame(self.sidebar_frame, text="Animation Settings")
         self.anim_speed_scale = ttk.Scale(
@@ -554,15 +880,16 @@ class LinkedListApp:
             "How to use:\n"
             "1. Enter value and click operation\n"
             "2. For position ops, specify index\n"
-            "3. Use Undo to revert changes\n\n"
+            f"3. Use Undo to revert changes (last {DoublyLinkedList.HISTORY_LIMIT} operations)\n\n"
             "Shortcuts:\n"
             "Ctrl+Z: Undo\n"
+            "Ctrl+L: Clear (Ctrl+Shift+L: no confirm)\n"
             "Enter: Insert at position"
         )
         self.help_text.config(state=tk.DISABLED)
         self.docs_btn = ttk.Button(
             self.help_frame, text="Open Documentation",
-            command=lambda: webbrowser.open("https://github.com/Vladislav-Karat/List-program.git")
+            command=partial(webbrowser.open, REPO_URL)
         )
 
     def _setup_layout(self) -> None:
@@ -585,7 +912,7 @@ class LinkedListApp:
             btn.grid(row=0, column=i, padx=3, sticky="ew")
         self.btn_frame.grid_columnconfigure(tuple(range(len(buttons))), weight=1)
         self.ops_frame.pack(fill=tk.X, pady=5)
-        ops_buttons = [self.to_list_btn, self.from_list_btn, self.export_btn, self.import_btn]
+        ops_buttons = [self.to_list_btn, self.from_list_btn, self.export_btn, self.import_btn, self.insert_csv_btn]
         for i, btn in enumerate(ops_buttons):
             btn.grid(row=0, column=i, padx=3, sticky="ew")
         self.ops_frame.grid_columnconfigure(tuple(range(len(ops_buttons))), weight=1)
@@ -611,17 +938,19 @@ class LinkedListApp:
 
     def _setup_bindings(self) -> None:
         self.index_entry.configure(validate="key",
-            validatecommand=(self.root.register(self._validate_index), "%P"))
-        self.canvas.bind("<Configure>", self._update_scroll_region)
+            validatecommand=(self._validate_index_command(), "%P"))
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
         self.root.bind("<Control-z>", lambda e: self._undo())
+        self.root.bind("<Control-l>", self._clear_list)
+        self.root.bind("<Control-L>", self._clear_list)
         self.value_entry.bind("<Return>", lambda e: self._insert("position"))
         self.index_entry.bind("<Return>", lambda e: self._insert("position"))
-        self.anim_speed_scale.bind("<Motion>", self._update_anim_speed_label)
+        self.anim_speed_scale.bind("<Motion>", self._schedule_speed_update)
 
     def _setup_menu(self) -> None:
         menubar = tk.Menu(self.root)
         file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="New", command=self._clear_list)
+        file_menu.add_command(label="New", command=self._clear_list, accelerator="Ctrl+L")
         file_menu.add_command(label="Open JSON...", command=self._import_from_json)
         file_menu.add_command(label="Save as JSON...", command=self._export_to_json)
         file_menu.add_separator()
@@ -634,22 +963,29 @@ class LinkedListApp:
         menubar.add_cascade(label="Edit", menu=edit_menu)
         view_menu = tk.Menu(menubar, tearoff=0)
         view_menu.add_radiobutton(label="Light Theme", variable=self.theme_var,
-                                value="light", command=lambda: self._change_theme(Theme.LIGHT))
+                                value="light", command=partial(self._change_theme, Theme.LIGHT))
         view_menu.add_radiobutton(label="Dark Theme", variable=self.theme_var,
-                                value="dark", command=lambda: self._change_theme(Theme.DARK))
+                                value="dark", command=partial(self._change_theme, Theme.DARK))
         view_menu.add_radiobutton(label="Blue Theme", variable=self.theme_var,
-                                value="blue", command=lambda: self._change_theme(Theme.BLUE))
+                                value="blue", command=partial(self._change_theme, Theme.BLUE))
         view_menu.add_radiobutton(label="Green Theme", variable=self.theme_var,
-                                value="green", command=lambda: self._change_theme(Theme.GREEN))
+                                value="green", command=partial(self._change_theme, Theme.GREEN))
         menubar.add_cascade(label="View", menu=view_menu)
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="Documentation",
-                            command=lambda: webbrowser.open("https://github.com/Vladislav-Karat/List-program.git"))
+                            command=partial(webbrowser.open, REPO_URL))
         help_menu.add_command(label="About", command=self._show_about)
         menubar.add_cascade(label="Help", menu=help_menu)
         self.root.config(menu=menubar)
 
+    def _schedule_speed_update(self, event=None) -> None:
+        # <Motion> fires for every pixel the pointer moves over the scale; update once it settles
+        if self._pending_speed_update:
+            self.root.after_cancel(self._pending_speed_update)
+        self._pending_speed_update = self.root.after(50, self._update_anim_speed_label)
+
     def _update_anim_speed_label(self, event=None) -> None:
+        self._pending_speed_update = None
         speed = round(self.anim_speed_scale.get(), 1)
         self.anim_speed_label.config(text=f"Speed: {speed}")
         self.animation_settings.speed = speed
@@ -659,13 +995,34 @@ class LinkedListApp:
         self.visualizer.set_theme(theme)
         self.update_display()
 
-    def _validate_index(self, text: str) -> bool:
-        return text.isdigit() or text == ""
+    def _validate_index_command(self) -> str:
+        """Register the index validator with Tcl once per root instead of once per app."""
+        command = getattr(self.root, "_validate_index_cmd", None)
+        if command is None:
+            command = self.root._validate_index_cmd = self.root.register(_validate_index_text)
+        return command
 
     def _update_scroll_region(self, event=None) -> None:
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.visualizer.update_scroll_region()
+
+    def _on_canvas_configure(self, event=None) -> None:
+        # Coalesce the burst of events fired while the window is being resized
+        if self._pending_resize:
+            self.root.after_cancel(self._pending_resize)
+        self._pending_resize = self.root.after(50, self._do_resize)
+
+    def _do_resize(self) -> None:
+        self._pending_resize = None
+        self._update_scroll_region()
+        self.visualizer.refresh_viewport()
+
+    def _on_xscroll(self, *args) -> None:
+        self.canvas.xview(*args)
+        self.visualizer.refresh_viewport()
 
     def _insert(self, position: str) -> None:
+        if self._busy():
+            return
         value = self.value_var.get()
         index_str = self.index_var.get()
         try:
@@ -683,14 +1040,28 @@ class LinkedListApp:
                 index = int(index_str)
                 self.linked_list.insert_at_position(index, value)
                 highlight = [index]
-            self.visualizer.animate_operation(highlight)
-            self._update_status(f"Inserted '{value}' at {position} (index {highlight[0]})", "success")
             self.update_display()
+            self._animate(highlight)
+            self._update_status(f"Inserted '{value}' at {position} (index {highlight[0]})", "success")
         except Exception as e:
             self._update_status(str(e), "error")
             self._highlight_error_fields(position)
 
+    def _insert_csv(self) -> None:
+        if self._busy():
+            return
+        values = [v.strip() for v in self.value_var.get().split(",") if v.strip()]
+        if not values:
+            self._update_status("Please enter comma-separated values", "error")
+            self._highlight_error_fields("tail")
+            return
+        self.linked_list.insert_many(values)
+        self.update_display()
+        self._update_status(f"Inserted {len(values)} values at tail", "success")
+
     def _delete(self) -> None:
+        if self._busy():
+            return
         index_str = self.index_var.get()
         try:
             if not index_str:
@@ -702,13 +1073,15 @@ class LinkedListApp:
                 highlight.append(index-1)
             if index < self.linked_list.length:
                 highlight.append(index)
-            self.visualizer.animate_operation(highlight)
-            self._update_status(f"Deleted value '{value}' at index {index}", "success")
             self.update_display()
+            self._animate(highlight)
+            self._update_status(f"Deleted value '{value}' at index {index}", "success")
         except Exception as e:
             self._update_status(str(e), "error")
 
     def _search(self) -> None:
+        if self._busy():
+            return
         value = self.value_var.get()
         try:
             if not value:
@@ -717,22 +1090,79 @@ class LinkedListApp:
             if index == -1:
                 self._update_status(f"Value '{value}' not found", "warning")
             else:
-                self.visualizer.animate_operation([index])
+                self._animate([index], blink=True)
                 self._update_status(f"Found '{value}' at index {index}", "success")
-            self.update_display()
         except Exception as e:
             self._update_status(str(e), "error")
 
-    def _clear_list(self) -> None:
+    def _animate(self, highlight: List[int], blink: bool = False) -> None:
+        self._animating = True
+        self._set_actions_state(tk.DISABLED)
+        if blink:
+            self.visualizer.blink(highlight[0], self._end_animation)
+        else:
+            self.visualizer.animate_operation(highlight, self._end_animation)
+
+    def _end_animation(self) -> None:
+        self._animating = False
+        self._set_actions_state(tk.NORMAL)
+
+    def _busy(self) -> bool:
+        # Shortcuts, menus and the sidebar bypass the disabled buttons, so every list change checks this
+        if self._animating:
+            self._update_status("Wait for the current animation to finish", "warning")
+        return self._animating
+
+    def _set_actions_state(self, state: str) -> None:
+        for btn in (self.insert_head_btn, self.insert_tail_btn, self.insert_pos_btn,
+                    self.delete_btn, self.search_btn, self.clear_btn, self.undo_btn):
+            btn.configure(state=state)
+
+    def _clear_list(self, event=None) -> None:
+        if self._busy():
+            return
         if self.linked_list.length == 0:
             self._update_status("List is already empty", "info")
             return
-        if messagebox.askyesno("Confirm Clear", "Are you sure you want to clear the list?"):
-            self.linked_list.clear()
-            self.update_display()
-            self._update_status("List cleared successfully", "success")
+        # Ctrl+Shift+L clears without asking
+        if event is not None and event.state & 0x0001:
+            self._do_clear()
+            return
+        self._confirm("Confirm Clear", "Are you sure you want to clear the list?", self._do_clear)
+
+    def _do_clear(self) -> None:
+        if self._busy():
+            return
+        self.linked_list.clear()
+        self.update_display()
+        self._update_status("List cleared successfully", "success")
+
+    def _confirm(self, title: str, message: str, on_yes) -> None:
+        """Non-modal yes/no dialog: returns to the mainloop immediately and runs on_yes on confirm."""
+        if self._confirm_dialog is not None and self._confirm_dialog.winfo_exists():
+            self._confirm_dialog.lift()
+            return
+        dialog = self._confirm_dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+
+        def confirm(event=None):
+            dialog.destroy()
+            on_yes()
+
+        ttk.Label(dialog, text=message).pack(padx=15, pady=(15, 10))
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(pady=(0, 10))
+        ttk.Button(btn_frame, text="Yes", command=confirm).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="No", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        dialog.bind("<Return>", confirm)
+        dialog.bind("<Escape>", lambda e: dialog.destroy())
+        dialog.focus_set()
 
     def _undo(self) -> None:
+        if self._busy():
+            return
         if self.linked_list.undo_last_operation():
             self.update_display()
             self._update_status("Undo successful", "success")
@@ -741,50 +1171,85 @@ class LinkedListApp:
 
     def _show_as_list(self) -> None:
         py_list = self.linked_list.to_list()
+        from tkinter import messagebox
         messagebox.showinfo("Python List", f"Current List:\n{py_list}")
 
     def _load_from_list(self) -> None:
-        input_str = simpledialog.askstring("Load from List", "Enter a Python list (e.g. [1,2,3]):")
+        """Show the (reused) Load from List prompt; the list is parsed when the user confirms."""
+        dialog = self._load_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._load_dialog = self._build_load_dialog()
+        self._load_var.set("")
+        dialog.deiconify()
+        dialog.lift()
+        self._load_entry.focus_set()
+
+    def _build_load_dialog(self) -> tk.Toplevel:
+        # Built once and withdrawn between uses instead of creating a new window per prompt
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.title("Load from List")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+
+        def confirm(event=None):
+            dialog.withdraw()
+            self._apply_loaded_list(self._load_var.get())
+
+        ttk.Label(dialog, text="Enter a Python list (e.g. [1,2,3]):").pack(padx=15, pady=(15, 5), anchor=tk.W)
+        self._load_entry = ttk.Entry(dialog, textvariable=self._load_var, width=40)
+        self._load_entry.pack(padx=15, pady=(0, 10))
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(pady=(0, 10))
+        ttk.Button(btn_frame, text="OK", command=confirm).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        dialog.bind("<Return>", confirm)
+        dialog.bind("<Escape>", lambda e: dialog.withdraw())
+        return dialog
+
+    def _apply_loaded_list(self, input_str: str) -> None:
+        if self._busy():
+            return
         if input_str:
             try:
-                values = json.loads(input_str.replace("'", '"'))
+                values = ast.literal_eval(input_str)
                 if not isinstance(values, list):
                     raise ValueError("Input is not a list")
                 self.linked_list.clear()
-                for v in values:
-                    self.linked_list.insert_at_tail(str(v))
+                self.linked_list.extend_from_iterable(values)
                 self.update_display()
                 self._update_status("Loaded from list successfully", "success")
             except Exception as e:
                 self._update_status(f"Error loading list: {e}", "error")
 
     def _export_to_json(self) -> None:
+        from tkinter import filedialog
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if file_path:
             try:
-                data = self.linked_list.to_list()
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                _write_json(file_path, self.linked_list.to_list())
                 self._update_status(f"Exported to {file_path}", "success")
             except Exception as e:
                 self._update_status(f"Export failed: {e}", "error")
 
     def _import_from_json(self) -> None:
+        if self._busy():
+            return
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if file_path:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _read_json(file_path)
                 if not isinstance(data, list):
                     raise ValueError("JSON does not contain a list")
                 self.linked_list.clear()
-                for v in data:
-                    self.linked_list.insert_at_tail(str(v))
+                self.linked_list.extend_from_iterable(data)
                 self.update_display()
                 self._update_status(f"Imported from {file_path}", "success")
             except Exception as e:
@@ -795,34 +1260,46 @@ class LinkedListApp:
             self.value_entry.configure(style="Error.TEntry")
         if position == "position":
             self.index_entry.configure(style="Error.TEntry")
-        self.root.after(1000, self._reset_entry_styles)
+        # Restart the timer so a repeated error keeps the fields red for the full second
+        if self._reset_styles_job is not None:
+            self.root.after_cancel(self._reset_styles_job)
+        self._reset_styles_job = self.root.after(1000, self._reset_entry_styles)
 
     def _reset_entry_styles(self) -> None:
+        self._reset_styles_job = None
         self.value_entry.configure(style="TEntry")
         self.index_entry.configure(style="TEntry")
 
     def _update_status(self, message: str, status: str = "info") -> None:
-        color = {
-            "success": "#388E3C",
-            "error": "#D32F2F",
-            "warning": "#FFA000",
-            "info": "#1976D2"
-        }.get(status, "#1976D2")
+        color = _STATUS_COLORS.get(status, _STATUS_COLORS["info"])
+        # Only the last message set while handling an event is ever seen, so apply it once on idle
+        self._pending_status = (message, color)
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self._flush_status)
+
+    def _flush_status(self) -> None:
+        self._status_scheduled = False
+        # Repeating the message already on screen would still round-trip through Tcl
+        if self._pending_status == self._shown_status:
+            return
+        self._shown_status = message, color = self._pending_status
         self.status_bar.config(text=message, foreground=color)
 
     def update_display(self) -> None:
         self.visualizer.set_animation_settings(self.animation_settings)
-        self.visualizer.draw()
-        self._update_scroll_region()
+        self.visualizer.schedule_redraw()
 
     def _add_sample_data(self) -> None:
+        if self._busy():
+            return
         self.linked_list.clear()
-        for v in ["A", "B", "C", "D"]:
-            self.linked_list.insert_at_tail(v)
+        self.linked_list.extend_from_iterable(["A", "B", "C", "D"])
         self.update_display()
         self._update_status("Sample data loaded", "success")
 
     def _show_about(self) -> None:
+        from tkinter import messagebox
         messagebox.showinfo(
             "HSE",
             "List Visualizer\n"
@@ -834,7 +1311,7 @@ class LinkedListApp:
 # ==================== ДОПОЛНИТЕЛЬНЫЕ ФУНКЦИИ И РАСШИРЕНИЯ ====================
 
 # --- Расширенная справка ---
-extended_help = """
+extended_help = f"""
 Ultimate Doubly Linked List Visualizer
 
 Возможности:
@@ -845,7 +1322,8 @@ Ultimate Doubly Linked List Visualizer
 - Сохранение и загрузка истории операций.
 
 Горячие клавиши:
-- Ctrl+Z — Undo
+- Ctrl+Z — Undo (хранятся последние {DoublyLinkedList.HISTORY_LIMIT} операций)
+- Ctrl+L — Очистка списка (Ctrl+Shift+L — без подтверждения)
 - Enter — Вставка по индексу
 
 Рекомендации:
@@ -856,10 +1334,12 @@ Ultimate Doubly Linked List Visualizer
 
 def show_extended_help():
     """Показать расширенную справку."""
+    from tkinter import messagebox
     messagebox.showinfo("Расширенная справка", extended_help)
 
 # --- Дополнительные темы оформления ---
-EXTRA_THEMES = {
+# Палитры только для чтения: apply_extra_theme отдаёт их визуализатору как есть, без копирования
+EXTRA_THEMES = {name: MappingProxyType(colors) for name, colors in {
     "PINK": {
         "normal": "#F8BBD0", "highlight": "#F06292", "head": "#F48FB1", "tail": "#EC407A",
         "arrow": "#AD1457", "prev_arrow": "#D81B60", "text": "#880E4F", "pointer_text": "#AD1457",
@@ -875,7 +1355,7 @@ EXTRA_THEMES = {
         "arrow": "#37474F", "prev_arrow": "#607D8B", "text": "#263238", "pointer_text": "#37474F",
         "border": "#78909C", "pointer_area": "#CFD8DC", "canvas_bg": "#ECEFF1"
     }
-}
+}.items()}
 
 def add_extra_themes(visualizer):
     """Добавляет дополнительные темы оформления."""
@@ -883,14 +1363,25 @@ def add_extra_themes(visualizer):
         visualizer.extra_themes = {}
     visualizer.extra_themes.update(EXTRA_THEMES)
 
+def apply_extra_theme(app, name):
+    """Применяет дополнительную тему: в Theme её нет, поэтому палитра ставится напрямую."""
+    visualizer = app.visualizer
+    visualizer.colors = EXTRA_THEMES[name]
+    visualizer._build_item_styles()
+    visualizer.canvas.config(bg=visualizer.colors["canvas_bg"])
+    visualizer.draw()
+
 # --- Генерация случайных данных ---
+_RANDOM_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
 def generate_random_data(linked_list, app):
     """Генерирует случайный список."""
+    import random
+    if app._busy():
+        return
     linked_list.clear()
-    count = random.randint(5, 15)
-    for _ in range(count):
-        value = random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
-        linked_list.insert_at_tail(value)
+    values = random.choices(_RANDOM_ALPHABET, k=random.randint(5, 15))
+    linked_list.extend_from_iterable(values)
     app.update_display()
     app._update_status("Случайные данные сгенерированы", "success")
 
@@ -902,26 +1393,38 @@ def clear_history(linked_list, app):
 
 def save_history(linked_list, app):
     """Сохраняет историю операций в файл."""
+    from tkinter import filedialog
     file_path = filedialog.asksaveasfilename(
         defaultextension=".json",
         filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
     )
     if file_path:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(linked_list.operation_history, f, ensure_ascii=False, indent=2)
+        # The log is capped, so it cannot be replayed from empty: store the contents it leads to
+        _write_json(file_path, {"values": linked_list.to_list(), "history": list(linked_list.operation_history)})
         app._update_status(f"История сохранена в {file_path}", "success")
 
 def load_history(linked_list, app):
     """Загружает историю операций из файла."""
+    if app._busy():
+        return
+    from tkinter import filedialog
     file_path = filedialog.askopenfilename(
         filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
     )
     if file_path:
-        with open(file_path, "r", encoding="utf-8") as f:
-            linked_list.operation_history = json.load(f)
-        if linked_list.operation_history:
-            last_state = linked_list.operation_history[-1]["state"]
-            linked_list._load_from_list(last_state)
+        try:
+            data = _read_json(file_path)
+            if not (isinstance(data, dict) and isinstance(data.get("values"), list)
+                    and isinstance(data.get("history"), list)):
+                raise ValueError("файл не содержит сохранённую историю")
+            op_types = {op.value for op in OperationType}
+            for entry in data["history"]:
+                if not (isinstance(entry, list) and len(entry) == 4 and entry[0] in op_types):
+                    raise ValueError(f"неверная запись истории: {entry!r}")
+            linked_list.restore(data["values"], data["history"])
+        except Exception as e:
+            app._update_status(f"Ошибка загрузки истории: {e}", "error")
+            return
         app.update_display()
         app._update_status(f"История загружена из {file_path}", "success")
 
@@ -930,31 +1433,21 @@ def add_extra_buttons(app):
     """Добавляет дополнительные кнопки в сайдбар."""
     extra_frame = ttk.LabelFrame(app.sidebar_frame, text="Дополнительно")
     extra_frame.pack(fill=tk.X, pady=5)
-    ttk.Button(extra_frame, text="Случайные данные", command=lambda: generate_random_data(app.linked_list, app)).pack(fill=tk.X, pady=2)
-    ttk.Button(extra_frame, text="Очистить историю", command=lambda: clear_history(app.linked_list, app)).pack(fill=tk.X, pady=2)
-    ttk.Button(extra_frame, text="Сохранить историю", command=lambda: save_history(app.linked_list, app)).pack(fill=tk.X, pady=2)
-    ttk.Button(extra_frame, text="Загрузить историю", command=lambda: load_history(app.linked_list, app)).pack(fill=tk.X, pady=2)
-    ttk.Button(extra_frame, text="Расширенная справка", command=show_extended_help).pack(fill=tk.X, pady=2)
+    for text, command in (
+        ("Случайные данные", partial(generate_random_data, app.linked_list, app)),
+        ("Очистить историю", partial(clear_history, app.linked_list, app)),
+        ("Сохранить историю", partial(save_history, app.linked_list, app)),
+        ("Загрузить историю", partial(load_history, app.linked_list, app)),
+        ("Расширенная справка", show_extended_help),
+    ):
+        ttk.Button(extra_frame, text=text, command=command).pack(fill=tk.X, pady=2)
 
     # Кнопки для новых тем
     theme_extra_frame = ttk.LabelFrame(app.sidebar_frame, text="Экстра темы")
     theme_extra_frame.pack(fill=tk.X, pady=5)
-    ttk.Button(theme_extra_frame, text="Pink", command=lambda: app._change_theme(Theme("PINK"))).pack(fill=tk.X, pady=1)
-    ttk.Button(theme_extra_frame, text="Orange", command=lambda: app._change_theme(Theme("ORANGE"))).pack(fill=tk.X, pady=1)
-    ttk.Button(theme_extra_frame, text="Gray", command=lambda: app._change_theme(Theme("GRAY"))).pack(fill=tk.X, pady=1)
-
-# --- Демонстрационные функции и заглушки для будущих фич ---
-def future_feature_1():
-    """Заглушка для будущей функции 1."""
-    pass
-
-def future_feature_2():
-    """Заглушка для будущей функции 2."""
-    pass
-
-def future_feature_3():
-    """Заглушка для будущей функции 3."""
-    pass
+    for name in EXTRA_THEMES:
+        ttk.Button(theme_extra_frame, text=name.capitalize(),
+                   command=partial(apply_extra_theme, app, name)).pack(fill=tk.X, pady=1)
 
 # --- Пример использования классов и функций ---
 def demo_usage():
@@ -969,27 +1462,10 @@ def demo_usage():
     dll.clear()
     print("After clear:", dll.to_list())
 
-# --- Псевдо-тесты (заглушки) ---
-def test_insert():
-    """Тест вставки."""
-    pass
-
-def test_delete():
-    """Тест удаления."""
-    pass
-
-def test_search():
-    """Тест поиска."""
-    pass
-
-def test_export_import():
-    """Тест экспорта/импорта."""
-    pass
-
 """
 Этот файл содержит расширенную версию визуализатора двусвязного списка.
-Добавлены дополнительные темы, справка, кнопки, заглушки для будущих функций,
-и демонстрационные вызовы. Вы можете использовать этот шаблон для расширения
+Добавлены дополнительные темы, справка, кнопки и демонстрационные
+вызовы; тесты находятся в test_main.py. Вы можете использовать этот шаблон для расширения
 своих учебных или демонстрационных проектов.
 """
 
@@ -998,7 +1474,9 @@ def main():
     app = LinkedListApp(root)
     add_extra_themes(app.visualizer)
     add_extra_buttons(app)
-    demo_usage()
+    # Демонстрация в консоли только по запросу: LIST_DEMO=1 python main.py
+    if os.environ.get("LIST_DEMO"):
+        demo_usage()
     root.mainloop()
 
 if __name__ == "__main__":
@@ -0,0 +1,292 @@
+import os
+import tempfile
+import tkinter
+import unittest
+from types import SimpleNamespace
+
+import main
+
+
+class FakeCanvas:
+    """Just enough of tk.Canvas for LinkedListVisualizer to run without a display."""
+
+    _w = ".canvas"
+    _options = tkinter.Misc._options
+
+    def __init__(self, width=1400):
+        self.tk = self
+        self.width = width
+        self.scroll_x = 0
+        self.items = {}
+        self.afters = []
+        self._next_id = 0
+
+    # Tcl interface used by the layout's fast path
+    def getint(self, value):
+        return int(value)
+
+    def call(self, path, command, kind, *args):
+        coords, options = [], {}
+        args = list(args)
+        while args and not (isinstance(args[0], str) and args[0].startswith("-")):
+            coords.append(args.pop(0))
+        while args:
+            name = args.pop(0)
+            options[name[1:]] = args.pop(0)
+        return str(self._create(kind, coords, options))
+
+    def _create(self, kind, coords, options):
+        self._next_id += 1
+        tags = options.pop("tags", ())
+        self.items[self._next_id] = dict(options, kind=kind, coords=list(coords),
+                                         tags={tags} if isinstance(tags, str) else set(tags))
+        return self._next_id
+
+    def _find(self, tag):
+        if tag == "all":
+            return list(self.items)
+        if isinstance(tag, int):
+            return [tag] if tag in self.items else []
+        return [item_id for item_id, item in self.items.items() if tag in item["tags"]]
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def delete(self, *tags):
+        for tag in tags:
+            for item_id in self._find(tag):
+                del self.items[item_id]
+
+    def coords(self, tag, *coords):
+        for item_id in self._find(tag):
+            self.items[item_id]["coords"] = list(coords)
+
+    def move(self, tag, dx, dy):
+        for item_id in self._find(tag):
+            item = self.items[item_id]
+            item["coords"] = [v + (dx if i % 2 == 0 else dy) for i, v in enumerate(item["coords"])]
+
+    def itemconfig(self, tag, **options):
+        for item_id in self._find(tag):
+            self.items[item_id].update(options)
+
+    def config(self, scrollregion=None, **options):
+        # Like Tk's confine option, keep the view inside the scroll region
+        if scrollregion is not None:
+            self.scroll_x = max(0, min(self.scroll_x, scrollregion[2] - self.width))
+
+    configure = config
+
+    def canvasx(self, x):
+        return x + self.scroll_x
+
+    def winfo_width(self):
+        return self.width
+
+    def after(self, ms, func, *args):
+        self.afters.append((func, args))
+
+    def after_idle(self, func, *args):
+        self.after(0, func, *args)
+
+    def run_pending(self):
+        while self.afters:
+            func, args = self.afters.pop(0)
+            func(*args)
+
+
+class LinkedListTest(unittest.TestCase):
+    def setUp(self):
+        self.linked_list = main.DoublyLinkedList()
+        self.linked_list.extend_from_iterable(["A", "B", "C", "D"])
+
+    def assertConsistent(self, expected):
+        """The linked chain, the mirrors and the value counts must all describe ``expected``."""
+        linked_list = self.linked_list
+        forward, node = [], linked_list.head
+        while node:
+            forward.append(node)
+            node = node.next
+        backward, node = [], linked_list.tail
+        while node:
+            backward.append(node)
+            node = node.prev
+        self.assertEqual([node.value for node in forward], expected)
+        self.assertEqual(backward[::-1], forward)
+        self.assertEqual(linked_list._nodes, forward)
+        self.assertEqual(linked_list._values, expected)
+        self.assertEqual(linked_list._counts, main.Counter(expected))
+        self.assertEqual(linked_list.length, len(expected))
+        self.assertEqual(linked_list.to_list(), expected)
+
+    def test_undo_single_operations(self):
+        self.linked_list.insert_at_head("H")
+        self.linked_list.insert_at_tail("T")
+        self.linked_list.insert_at_position(3, "P")
+        self.assertConsistent(["H", "A", "B", "P", "C", "D", "T"])
+        self.assertEqual(self.linked_list.delete_at_position(2), "B")
+        self.assertConsistent(["H", "A", "P", "C", "D", "T"])
+        for expected in (["H", "A", "B", "P", "C", "D", "T"],
+                         ["H", "A", "B", "C", "D", "T"],
+                         ["H", "A", "B", "C", "D"],
+                         ["A", "B", "C", "D"]):
+            self.assertTrue(self.linked_list.undo_last_operation())
+            self.assertConsistent(expected)
+
+    def test_undo_insert_many(self):
+        self.linked_list.insert_many(["X", "Y"], at="head")
+        self.linked_list.insert_many(["Z", "A"])
+        self.assertConsistent(["X", "Y", "A", "B", "C", "D", "Z", "A"])
+        self.linked_list.undo_last_operation()
+        self.assertConsistent(["X", "Y", "A", "B", "C", "D"])
+        self.linked_list.undo_last_operation()
+        self.assertConsistent(["A", "B", "C", "D"])
+
+    def test_undo_load_and_clear(self):
+        self.linked_list.clear()
+        self.assertConsistent([])
+        self.linked_list.extend_from_iterable([1, 2])
+        self.assertConsistent(["1", "2"])
+        self.linked_list.undo_last_operation()
+        self.assertConsistent([])
+        self.linked_list.undo_last_operation()
+        self.assertConsistent(["A", "B", "C", "D"])
+        # Undo everything, down to the initial load
+        self.assertTrue(self.linked_list.undo_last_operation())
+        self.assertConsistent([])
+        self.assertFalse(self.linked_list.undo_last_operation())
+
+    def test_search_follows_the_mirrors(self):
+        self.linked_list.insert_at_position(1, "C")
+        self.assertEqual(self.linked_list.search("C"), 1)
+        self.linked_list.delete_at_position(1)
+        self.assertEqual(self.linked_list.search("C"), 2)
+        self.linked_list.delete_at_position(2)
+        self.assertEqual(self.linked_list.search("C"), -1)
+
+    def test_history_is_capped(self):
+        for i in range(main.DoublyLinkedList.HISTORY_LIMIT + 10):
+            self.linked_list.insert_at_tail(i)
+        self.assertEqual(len(self.linked_list.operation_history), main.DoublyLinkedList.HISTORY_LIMIT)
+
+    def test_history_round_trip(self):
+        self.linked_list.insert_at_head("H")
+        self.linked_list.insert_many(["X", "Y"])
+        self.linked_list.delete_at_position(2)
+        self.linked_list.clear()
+        self.linked_list.extend_from_iterable(["L"])
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        main._write_json(path, {"values": self.linked_list.to_list(),
+                                "history": list(self.linked_list.operation_history)})
+        data = main._read_json(path)
+        self.linked_list = main.DoublyLinkedList()
+        self.linked_list.restore(data["values"], data["history"])
+        self.assertConsistent(["L"])
+        for expected in ([],
+                         ["H", "A", "C", "D", "X", "Y"],
+                         ["H", "A", "B", "C", "D", "X", "Y"],
+                         ["H", "A", "B", "C", "D"],
+                         ["A", "B", "C", "D"],
+                         []):
+            self.assertTrue(self.linked_list.undo_last_operation())
+            self.assertConsistent(expected)
+        self.assertFalse(self.linked_list.undo_last_operation())
+
+    def test_released_nodes_drop_their_data(self):
+        self.linked_list._nodes[1].canvas_ids = {"rect": 1}
+        self.linked_list.delete_at_position(1)
+        self.linked_list.clear()
+        self.assertEqual(len(self.linked_list._pool), 4)
+        for node in self.linked_list._pool:
+            self.assertEqual((node.value, node.label, node.next, node.prev, node.canvas_ids),
+                             (None, None, None, None, None))
+
+    def test_restore_rejects_mismatched_history(self):
+        history = list(self.linked_list.operation_history)
+        with self.assertRaises(ValueError):
+            self.linked_list.restore(["X"], history)
+        with self.assertRaises(ValueError):
+            self.linked_list.restore(["X"], [(main.OperationType.INSERT_POS.value, "X", 5, 0)])
+        self.assertEqual(self.linked_list.to_list(), ["A", "B", "C", "D"])
+        self.assertEqual(list(self.linked_list.operation_history), history)
+
+    def test_failed_undo_keeps_its_entry(self):
+        self.linked_list.operation_history.append((main.OperationType.DELETE.value, "X", 9, 0))
+        with self.assertRaises(IndexError):
+            self.linked_list.undo_last_operation()
+        self.assertEqual(len(self.linked_list.operation_history), 2)
+        self.assertEqual(self.linked_list.to_list(), ["A", "B", "C", "D"])
+
+
+class VisualizerTest(unittest.TestCase):
+    def setUp(self):
+        self.canvas = FakeCanvas()
+        self.linked_list = main.DoublyLinkedList()
+        self.linked_list.extend_from_iterable(["A", "B", "C", "D"])
+        self.visualizer = main.LinkedListVisualizer(self.canvas, self.linked_list)
+        self.visualizer.draw()
+
+    def _info_text(self):
+        return self.canvas.items[self.visualizer._info_id]["text"]
+
+    def _labels(self):
+        return [item["text"] for item in sorted(self.canvas.items.values(), key=lambda item: item["coords"])
+                if item["kind"] == "text" and str(item.get("text")).startswith("Data:")]
+
+    def test_reload_during_animation(self):
+        done = []
+        self.linked_list.delete_at_position(3)
+        self.visualizer.schedule_redraw()
+        self.visualizer.animate_operation([0, 1, 2], callback=lambda: done.append(True))
+        # Replace the list mid-animation: the released nodes are reused under new ids
+        self.linked_list.clear()
+        self.linked_list.extend_from_iterable(["W", "X", "Y", "Z"])
+        self.visualizer.schedule_redraw()
+        self.canvas.run_pending()
+        self.assertEqual(done, [True])
+        self.assertEqual(self.visualizer.current_highlight, -1)
+        self.assertTrue(self._info_text().startswith("Length: 4"))
+        self.assertEqual(self._labels(), ["Data: W", "Data: X", "Data: Y", "Data: Z"])
+
+    def test_shrink_while_scrolled_to_end(self):
+        self.linked_list.extend_from_iterable(str(i) for i in range(100))
+        self.visualizer.schedule_redraw()
+        self.canvas.run_pending()
+        self.canvas.scroll_x = self.visualizer.content_width - self.canvas.width
+        self.visualizer.refresh_viewport()
+        self.linked_list.clear()
+        self.linked_list.extend_from_iterable(["X", "Y", "Z"])
+        self.visualizer.schedule_redraw()
+        self.canvas.run_pending()
+        self.assertEqual(self.canvas.scroll_x, 0)
+        self.assertEqual(self._labels(), ["Data: X", "Data: Y", "Data: Z"])
+
+    def test_draw_highlight_is_cleared(self):
+        self.visualizer.draw(1)
+        self.linked_list.insert_at_head("N")
+        self.visualizer.schedule_redraw()
+        self.visualizer.highlight(-1)
+        highlight = self.visualizer.colors["highlight"]
+        self.assertFalse([item for item in self.canvas.items.values() if item.get("fill") == highlight])
+
+    def test_extra_theme(self):
+        main.apply_extra_theme(SimpleNamespace(visualizer=self.visualizer), "PINK")
+        rects = [item for item in self.canvas.items.values() if "node_bg" in item["tags"]]
+        self.assertEqual(rects[0]["fill"], main.EXTRA_THEMES["PINK"]["head"])
+        self.assertEqual(rects[1]["fill"], main.EXTRA_THEMES["PINK"]["normal"])
+
+    def test_insert_during_blink(self):
+        self.visualizer.blink(3)
+        func, args = self.canvas.afters.pop(0)
+        func(*args)
+        self.linked_list.insert_at_head("N")
+        self.visualizer.schedule_redraw()
+        self.visualizer.flush_redraw()
+        highlight = self.visualizer.colors["highlight"]
+        self.assertFalse([item for item in self.canvas.items.values() if item.get("fill") == highlight])
+
+
+if __name__ == "__main__":
+    unittest.main()